@@ -0,0 +1,153 @@
+import asyncio
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import aiohttp
+import discord
+
+from utils import get_shortened
+from initialization import sync_api
+
+# The Sync API Rejects Requests With More Commands Than This
+MAX_COMMANDS = 100
+
+
+@dataclass
+class BulkLine:
+    line_number: int
+    content: str
+    depth: int
+    temp_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    parent: "BulkLine | None" = None
+    task_id: str | None = None
+    error: str | None = None
+
+
+async def parse_lines(text: str) -> list[BulkLine]:
+    """
+    Turns Multi-Line Input Into Tasks, Indenting A Line Makes It A Subtask Of The Line Above It
+    Leading Bullets Like "-" Or "*" Are Removed So Pasted Lists Work
+
+    :param text: The Raw Text With One Task Per Line
+    :return: The Parsed Lines With Their Parents Linked
+    """
+    lines = []
+    # Stack Of (Indent, Line) For The Current Chain Of Parents
+    stack: list[tuple[int, BulkLine]] = []
+    for number, raw in enumerate(text.splitlines(), start=1):
+        expanded = raw.expandtabs(4)
+        content = expanded.strip()
+        if content[:2] in ("- ", "* ") or content in ("-", "*"):
+            content = content[1:].strip()
+        if not content:
+            continue
+        indent = len(expanded) - len(expanded.lstrip())
+
+        while stack and stack[-1][0] >= indent:
+            stack.pop()
+        line = BulkLine(
+            line_number=number,
+            content=content,
+            depth=len(stack),
+            parent=stack[-1][1] if stack else None,
+        )
+        stack.append((indent, line))
+        lines.append(line)
+    return lines
+
+
+async def add_tasks_bulk(lines: list[BulkLine]) -> None:
+    """
+    Creates All The Tasks Using A Single Request To The Sync API
+    Subtasks Reference Their Parent By Temp ID So They Can Be Created In The Same Batch
+    The Results Are Stored On Each Line As Either A Task ID Or An Error
+
+    :param lines: The Lines From :func:`parse_lines`
+    """
+    for line in lines[MAX_COMMANDS:]:
+        line.error = f"Only {MAX_COMMANDS} Tasks Can Be Added At Once"
+    lines = lines[:MAX_COMMANDS]
+
+    commands = []
+    for line in lines:
+        args = {"content": line.content}
+        if line.parent:
+            args["parent_id"] = line.parent.temp_id
+        commands.append(
+            {
+                "type": "item_add",
+                "temp_id": line.temp_id,
+                "uuid": str(uuid.uuid4()),
+                "args": args,
+            }
+        )
+
+    try:
+        data = await sync_api.sync(commands)
+        statuses = data["sync_status"]
+        mapping = data["temp_id_mapping"]
+    except asyncio.TimeoutError:
+        for line in lines:
+            line.error = "Timed Out Waiting For ToDoist"
+        return
+    except (aiohttp.ClientError, KeyError, TypeError, ValueError) as error:
+        for line in lines:
+            line.error = f"Unexpected Response From ToDoist: {error!r}"
+        return
+
+    for line, command in zip(lines, commands):
+        status = statuses.get(command["uuid"])
+        if status == "ok":
+            line.task_id = mapping.get(line.temp_id)
+        elif isinstance(status, dict):
+            line.error = status.get("error", "Unknown Error")
+        else:
+            line.error = "Unknown Error"
+
+
+async def get_bulk_summary(lines: list[BulkLine]) -> discord.Embed:
+    added = [line for line in lines if line.task_id]
+    failed = [line for line in lines if line.error]
+    e = discord.Embed(
+        title=f"Added {len(added)} Of {len(lines)} Tasks",
+        timestamp=datetime.now(),
+        color=56908 if not failed else 14431557,
+    )
+    e.set_footer(text="Last Updated")
+
+    description = ""
+    for line in added:
+        description += "  " * line.depth + f"- {await get_shortened(line.content, 50)} `{line.task_id}`\n"
+    e.description = await get_shortened(description, 4000)
+
+    if failed:
+        failed_display = ""
+        for line in failed:
+            failed_display += f"Line {line.line_number}: {await get_shortened(line.content, 30)} | {line.error}\n"
+        e.add_field(name="Failed", value=await get_shortened(failed_display, 1024), inline=False)
+    return e
+
+
+class BulkTaskModal(discord.ui.Modal):
+    def __init__(self):
+        super().__init__(title="Add Multiple Tasks", timeout=600)
+        self.add_item(
+            discord.ui.InputText(
+                label="Tasks",
+                placeholder="One Task Per Line. Indent A Line To Make It A Subtask",
+                style=discord.InputTextStyle.long,
+                max_length=4000,
+            )
+        )
+
+    async def callback(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+        try:
+            lines = await parse_lines(self.children[0].value)
+            if not lines:
+                return await interaction.respond("No Tasks Found", ephemeral=True)
+            await add_tasks_bulk(lines)
+            await interaction.respond(embed=await get_bulk_summary(lines), ephemeral=True)
+        except Exception as error:
+            await interaction.respond(error, ephemeral=True)
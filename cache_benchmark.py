@@ -0,0 +1,68 @@
+"""
+Measures How Many Bytes Each Cached Task Uses As A :class:`Task` Compared To A :class:`CachedTask`
+Run With `python cache_benchmark.py`, It Does Not Need A ToDoist Token Or Network Access
+"""
+import json
+import random
+import tracemalloc
+
+from todoist_api_python.models import Task
+
+from caches import CachedTask
+
+PROJECTS = [str(2200000000 + i) for i in range(20)]
+LABELS = ["work", "home", "errands", "reading", "urgent", "waiting", "discord", "someday"]
+DUE_STRINGS = ["today", "tomorrow", "every day", "every monday", "next week"]
+
+
+def make_task_json(number: int) -> str:
+    task_id = str(7000000000 + number)
+    return json.dumps({
+        "assignee_id": None,
+        "assigner_id": None,
+        "comment_count": 0,
+        "is_completed": False,
+        "content": f"Task Number {number}",
+        "created_at": "2024-05-01T12:00:00.000000Z",
+        "creator_id": "42222222",
+        "description": "",
+        "due": (
+            {
+                "date": "2024-05-02",
+                "is_recurring": False,
+                "string": random.choice(DUE_STRINGS),
+                "datetime": None,
+                "timezone": None,
+            }
+            if number % 2
+            else None
+        ),
+        "id": task_id,
+        "labels": random.sample(LABELS, k=number % 3),
+        "order": number,
+        "parent_id": None,
+        "priority": 1,
+        "project_id": random.choice(PROJECTS),
+        "section_id": None,
+        "url": f"https://todoist.com/showTask?id={task_id}",
+    })
+
+
+def measure(count: int, compact: bool) -> float:
+    # Decode Inside The Trace So Strings Are Counted And Duplicated The Same Way As API Responses
+    data = [make_task_json(i) for i in range(count)]
+    tracemalloc.start()
+    tasks = [Task.from_dict(json.loads(d)) for d in data]
+    if compact:
+        tasks = [CachedTask(t) for t in tasks]
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return used / count
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    for amount in (10_000, 100_000):
+        full = measure(amount, compact=False)
+        compact = measure(amount, compact=True)
+        print(f"{amount} Tasks | Task: {full:.0f} B/task | CachedTask: {compact:.0f} B/task | {compact / full:.0%}")
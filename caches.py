@@ -1,9 +1,60 @@
 import asyncio
+import sys
+from dataclasses import fields, replace
 from time import monotonic
 
 from todoist_api_python.models import Label, Task
 from todoist_api_python.api_async import TodoistAPIAsync
 
+from events import TaskEventBus, TaskSubscriber
+
+
+class CachedTask:
+    """
+    A Compact Copy Of A :class:`Task` For Holding In The Caches
+    IDs, Label Names And Due Strings Are Interned So Every Cached Task Shares The Same Strings
+    Use :meth:`to_task` When A Full :class:`Task` Is Needed
+    """
+
+    __slots__ = tuple(f.name for f in fields(Task))
+    INTERNED = frozenset(
+        {"id", "project_id", "section_id", "parent_id", "creator_id", "assignee_id", "assigner_id"}
+    )
+
+    def __init__(self, task: Task) -> None:
+        for name in self.__slots__:
+            value = getattr(task, name)
+            if name == "labels" and value is not None:
+                value = tuple(sys.intern(label) for label in value)
+            elif name == "due" and value is not None:
+                # Copied Rather Than Changed In Place As The Original Task May Still Be In Use
+                value = replace(
+                    value,
+                    string=sys.intern(value.string),
+                    date=sys.intern(value.date),
+                )
+            elif name in self.INTERNED and value is not None:
+                value = sys.intern(value)
+            setattr(self, name, value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CachedTask):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self) -> int:
+        # Equal Tasks Always Share An ID So This Stays Consistent With __eq__
+        return hash(self.id)
+
+    def __repr__(self) -> str:
+        return f"CachedTask(id={self.id!r}, content={self.content!r})"
+
+    def to_task(self) -> Task:
+        values = {name: getattr(self, name) for name in self.__slots__}
+        if values["labels"] is not None:
+            values["labels"] = list(values["labels"])
+        return Task(**values)
+
 
 class TaskAutocompleteCooldown:
     def __init__(self, seconds: int) -> None:
@@ -21,11 +72,11 @@ class TaskAutocompleteCooldown:
                 return True
             return False
 
-    async def set_cache(self, user_id: int, tasks: list) -> None:
+    async def set_cache(self, user_id: int, tasks: list[Task]) -> None:
         async with self.lock:
-            self.cache[user_id] = tasks
+            self.cache[user_id] = [CachedTask(t) for t in tasks]
 
-    async def get_cache(self, user_id: int) -> list:
+    async def get_cache(self, user_id: int) -> list[CachedTask]:
         async with self.lock:
             return self.cache[user_id]
 
@@ -54,12 +105,13 @@ class LabelsCache:
 
 
 class TaskCache:
-    def __init__(self, seconds: int, api: TodoistAPIAsync) -> None:
+    def __init__(self, seconds: int, api: TodoistAPIAsync, events: TaskEventBus) -> None:
         self.seconds = seconds
         self.last_executed = 0
         self.lock = asyncio.Lock()
-        self.tasks: list[Task] | None = None
+        self.tasks: list[CachedTask] | None = None
         self.api = api
+        self.events = events
 
     async def can_execute(self) -> bool:
         async with self.lock:
@@ -69,7 +121,60 @@ class TaskCache:
                 return True
             return False
 
-    async def get_tasks(self) -> list[Task]:
+    async def get_tasks(self) -> list[CachedTask]:
         if await self.can_execute():
-            self.tasks = await self.api.get_tasks()
+            self.update(await self.api.get_tasks())
         return self.tasks
+
+    def update(self, tasks: list[Task]) -> None:
+        """
+        Replace The Cache With A Full Fetch Of Tasks And Publish Anything That Changed
+        Any Full Fetch Should Go Through Here So Views Built From It Have Something To Be Compared Against
+
+        :param tasks: Every Active Task As Returned By The API
+        """
+        self.last_executed = monotonic()
+        previous = {t.id: t for t in self.tasks or []}
+        self.tasks = [CachedTask(t) for t in tasks]
+
+        # Let Open Views Know About Anything That Changed Since They Were Built
+        for task in self.tasks:
+            old = previous.pop(task.id, None)
+            if old is None:
+                # Only Matters If A View Is Open For It, IE A Task That Was Reopened
+                if task.id in self.events.subscribers:
+                    self.events.publish(task.to_task())
+            elif old != task:
+                self.events.publish(task.to_task())
+        # Only Active Tasks Are Fetched So Anything Missing Was Completed Or Deleted
+        for old in previous.values():
+            if not old.is_completed:
+                gone = old.to_task()
+                gone.is_completed = True
+                self.events.publish(gone)
+
+    def remember(self, task: Task) -> None:
+        """
+        Store The Task As A View Is Showing It Without Publishing Anything
+        The Next Fetch Is Compared Against This So Changes Made Before Then Still Reach The View
+
+        :param task: The Task Object The View Was Built From
+        """
+        if self.tasks is None:
+            self.tasks = []
+        for i, cached in enumerate(self.tasks):
+            if cached.id == task.id:
+                self.tasks[i] = CachedTask(task)
+                return
+        self.tasks.append(CachedTask(task))
+
+    def publish(self, task: Task, source: TaskSubscriber | None = None) -> None:
+        """
+        Publish A Change Made From A View And Update The Cached Copy To Match
+        This Stops The Next Fetch From Sending The Same Change Back Out To The Views
+
+        :param task: The Updated Task Object
+        :param source: The View That Made The Change, See :meth:`TaskEventBus.publish`
+        """
+        self.remember(task)
+        self.events.publish(task, source=source)
@@ -0,0 +1,88 @@
+import asyncio
+import logging
+import weakref
+from typing import Awaitable, Callable, Protocol
+
+from todoist_api_python.models import Task
+
+logger = logging.getLogger(__name__)
+
+
+class TaskSubscriber(Protocol):
+    async def on_task_update(self, task: Task) -> None: ...
+
+
+class TaskEventBus:
+    """
+    Fans Out Task Changes To Any Open Views That Are Showing That Task
+    Subscribers Are Weakly Held So Expired Views Are Collected Without Needing To Unsubscribe
+    Multiple Changes To The Same Task Within The Delay Are Merged Into A Single Update
+    """
+
+    def __init__(self, delay: float, refresh_interval: float = 30) -> None:
+        self.delay = delay
+        self.refresh_interval = refresh_interval
+        # Called Periodically While Anything Is Subscribed So Idle Views Still Get Updates
+        self.refresh: Callable[[], Awaitable] | None = None
+        self.refresher: asyncio.Future | None = None
+        self.subscribers: dict[str, weakref.WeakSet[TaskSubscriber]] = {}
+        self.pending: dict[str, tuple[Task, TaskSubscriber | None]] = {}
+        self.futures: dict[str, asyncio.Future] = {}
+
+    def subscribe(self, task_id: str, subscriber: TaskSubscriber) -> None:
+        self.subscribers.setdefault(task_id, weakref.WeakSet()).add(subscriber)
+        # Drop The Set For This Task Once Its Last Subscriber Is Collected
+        weakref.finalize(subscriber, self.prune, task_id)
+        if self.refresh is not None and self.refresher is None:
+            self.refresher = asyncio.ensure_future(self.refresh_while_subscribed())
+
+    def unsubscribe(self, task_id: str, subscriber: TaskSubscriber) -> None:
+        if task_id in self.subscribers:
+            self.subscribers[task_id].discard(subscriber)
+            self.prune(task_id)
+
+    def prune(self, task_id: str) -> None:
+        # Iterate Instead Of Using len() As Collected Entries Can Still Be Counted Until Their Removal Runs
+        if task_id in self.subscribers and not list(self.subscribers[task_id]):
+            del self.subscribers[task_id]
+
+    def publish(self, task: Task, source: TaskSubscriber | None = None) -> None:
+        """
+        Queue An Update For All Subscribers Of The Task
+
+        :param task: The Updated Task Object
+        :param source: The Subscriber That Made The Change, It Will Not Be Sent Its Own Update
+        """
+        if task.id in self.pending and self.pending[task.id][1] is not source:
+            # Changes Came From Different Places So Everyone Needs The Merged Result
+            source = None
+        self.pending[task.id] = (task, source)
+        if task.id not in self.futures:
+            self.futures[task.id] = asyncio.ensure_future(self.dispatch(task.id))
+
+    async def dispatch(self, task_id: str) -> None:
+        await asyncio.sleep(self.delay)
+        del self.futures[task_id]
+        task, source = self.pending.pop(task_id)
+
+        subscribers = [s for s in self.subscribers.get(task_id, ()) if s is not source]
+        results = await asyncio.gather(
+            *(s.on_task_update(task) for s in subscribers),
+            return_exceptions=True,
+        )
+        for subscriber, result in zip(subscribers, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Failed To Update %r For Task %s", subscriber, task_id, exc_info=result
+                )
+
+    async def refresh_while_subscribed(self) -> None:
+        try:
+            while self.subscribers:
+                await asyncio.sleep(self.refresh_interval)
+                try:
+                    await self.refresh()
+                except Exception:
+                    logger.exception("Failed To Refresh Tasks For Open Views")
+        finally:
+            self.refresher = None
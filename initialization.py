@@ -2,10 +2,24 @@ import discord
 import os
 from todoist_api_python.api_async import TodoistAPIAsync
 from caches import LabelsCache, TaskAutocompleteCooldown, TaskCache
+from events import TaskEventBus
+from sync_api import TodoistSyncAPI
 
-bot = discord.Bot()
-api = TodoistAPIAsync(os.getenv("todoist_token"))
+todoist_token = os.getenv("todoist_token")
+api = TodoistAPIAsync(todoist_token)
+sync_api = TodoistSyncAPI(todoist_token)
+
+
+class TodoBot(discord.Bot):
+    async def close(self) -> None:
+        await sync_api.close()
+        await super().close()
+
+
+bot = TodoBot()
 
 label_cache = LabelsCache(60, api)
 task_autocomplete_cooldown = TaskAutocompleteCooldown(seconds=15)
-task_cache = TaskCache(15, api)
+task_events = TaskEventBus(delay=2)
+task_cache = TaskCache(15, api, task_events)
+task_events.refresh = task_cache.get_tasks
@@ -5,6 +5,7 @@ import utils
 from utils import get_task_info, get_subtasks_recursive
 from plan_pages import create_pages
 from views import AddTaskOptions
+from bulk import BulkTaskModal, parse_lines, add_tasks_bulk, get_bulk_summary
 from initialization import bot, api, label_cache, task_autocomplete_cooldown, task_cache
 
 
@@ -15,6 +16,7 @@ from initialization import bot, api, label_cache, task_autocomplete_cooldown, ta
 async def plan(ctx: discord.ApplicationContext):
     await ctx.defer()
     tasks = await api.get_tasks()
+    task_cache.update(tasks)
     paginator = await create_pages(tasks, await api.get_projects())
     await paginator.respond(interaction=ctx.interaction, ephemeral=True)
 
@@ -24,8 +26,14 @@ async def plan(ctx: discord.ApplicationContext):
 )
 async def todo(
     ctx: discord.ApplicationContext,
-    task: discord.Option(str, description="The Task To Complete"),
+    task: discord.Option(
+        str,
+        description="The Task To Complete. Leave Empty To Add Multiple Tasks At Once",
+        required=False,
+    ),
 ):
+    if not task:
+        return await ctx.send_modal(BulkTaskModal())
     await ctx.defer(ephemeral=True)
     response = await api.add_task(content=task)
     view = AddTaskOptions(response, await api.get_labels())
@@ -68,6 +76,28 @@ async def mark_as_todo(ctx: discord.ApplicationContext, message: discord.Message
         await ctx.respond(error, ephemeral=True)
 
 
+# Message Commands Only Ever Target One Message, So This Splits The Lines Of That Message
+# It Does Not Capture Several Messages At Once
+@bot.message_command(
+    integration_types={discord.IntegrationType.user_install},
+    name="Mark Lines As ToDo",
+)
+async def mark_lines_as_todo(ctx: discord.ApplicationContext, message: discord.Message):
+    await ctx.defer(ephemeral=True)
+    try:
+        lines = await parse_lines(message.content)
+        if not lines:
+            return await ctx.respond("No Tasks Found", ephemeral=True)
+        # Link Back To The Message On The Top Level Tasks Only So Subtasks Stay Readable
+        for line in lines:
+            if line.parent is None:
+                line.content += f" | [Discord Jump]({message.jump_url})"
+        await add_tasks_bulk(lines)
+        await ctx.respond(embed=await get_bulk_summary(lines), ephemeral=True)
+    except Exception as error:
+        await ctx.respond(error, ephemeral=True)
+
+
 async def tasks_autocomplete(ctx: discord.AutocompleteContext):
     if await task_autocomplete_cooldown.can_execute(ctx.interaction.user.id):
         tasks = await api.get_tasks()
@@ -1,16 +1,24 @@
 from discord import Interaction
 from discord.ext import pages
 import discord
-from utils import get_due_datetime, get_task_info, get_subtasks_recursive
+from utils import get_due_datetime, get_shortened, get_task_info, get_subtasks_recursive
 from datetime import datetime
 from todoist_api_python.models import Task, Project
-from initialization import label_cache, task_cache
+from initialization import label_cache, task_cache, task_events
 from views import AddTaskOptions
 
 
+async def get_display_name(task: Task, length: int) -> str:
+    # Tasks Completed While The Page Is Open Stay Listed So They Can Still Be Reopened
+    return await get_shortened(f"{'✅ ' if task.is_completed else ''}{task.content}", length)
+
+
 class TaskSelector(discord.ui.Select):
     def __init__(self, tasks: list[Task]):
         self.tasks = {t.id: t for t in tasks}
+        # Set Once The Page And Paginator Exist So Updates Can Re-Render The Page
+        self.page: pages.Page | None = None
+        self.paginator: pages.Paginator | None = None
         options = [
             discord.SelectOption(
                 label=t.content[: min(len(t.content), 100)],
@@ -20,6 +28,32 @@ class TaskSelector(discord.ui.Select):
             for t in tasks
         ]
         super().__init__(placeholder="Select A Task For More Info", options=options)
+        for task_id in self.tasks:
+            task_events.subscribe(task_id, self)
+
+    def unsubscribe(self):
+        for task_id in self.tasks:
+            task_events.unsubscribe(task_id, self)
+
+    async def on_task_update(self, task: Task):
+        self.tasks[task.id] = task
+        for option in self.options:
+            if option.value == task.id:
+                option.label = await get_display_name(task, 100)
+                option.description = task.description[: min(len(task.description), 100)]
+        if self.page is None or self.paginator is None:
+            return
+        self.page.embeds = [await create_embed(list(self.tasks.values()))]
+        # Only The Page Currently Being Shown Needs The Message Edited
+        if (
+            self.paginator.message is not None
+            and not self.paginator.is_finished()
+            and self.paginator.pages[self.paginator.current_page] is self.page
+        ):
+            try:
+                await self.paginator.goto_page(self.paginator.current_page)
+            except discord.HTTPException:
+                self.unsubscribe()
 
     async def callback(self, interaction: Interaction):
         task = self.tasks[self.values[0]]
@@ -33,38 +67,56 @@ class TaskSelector(discord.ui.Select):
         )
 
 
+async def create_embed(section_tasks: list[Task]) -> discord.Embed:
+    embed = discord.Embed(title="Your Tasks")
+    embed.set_footer(text="Last Updated")
+    embed.timestamp = datetime.now()
+
+    for task in section_tasks:
+        if task.parent_id:
+            continue
+        v = f"`{task.id}`"
+        if due := await get_due_datetime(task):
+            v += f" | Due {discord.utils.format_dt(due, 'R')}"
+        v += f"\n{task.description}" if task.description else ""
+        if subtasks := [st for st in section_tasks if st.parent_id == task.id]:
+            v += "\n**Sub-Tasks:**"
+            for subtask in subtasks:
+                v += f"\n- {await get_display_name(subtask, 256)} | [{subtask.id}]({subtask.url})"
+                if due := await get_due_datetime(subtask):
+                    v += f" | Due {discord.utils.format_dt(due, 'R')}"
+        embed.add_field(
+            name=await get_display_name(task, 256),
+            value=v,
+            inline=False,
+        )
+    return embed
+
+
+class PlanPaginator(pages.Paginator):
+    def __init__(self, *args, selectors: list[TaskSelector], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.selectors = selectors
+        for selector in selectors:
+            selector.paginator = self
+
+    def unsubscribe(self):
+        # Stop Receiving Updates Straight Away Rather Than Waiting For The Garbage Collector
+        for selector in self.selectors:
+            selector.unsubscribe()
+
+    async def on_timeout(self):
+        self.unsubscribe()
+        await super().on_timeout()
+
+    def stop(self):
+        self.unsubscribe()
+        super().stop()
+
+
 async def create_pages(
     tasks: list[Task], project_obj: list[Project]
-) -> pages.Paginator:
-    async def create_embed(section_tasks: list[Task]) -> discord.Embed:
-        embed = discord.Embed(title="Your Tasks")
-        embed.set_footer(text="Last Updated")
-        embed.timestamp = datetime.now()
-
-        for task in section_tasks:
-            if task.parent_id:
-                continue
-            v = f"`{task.id}`"
-            if due := await get_due_datetime(task):
-                v += f" | Due {discord.utils.format_dt(due, 'R')}"
-            v += f"\n{task.description}" if task.description else ""
-            if subtasks := [st for st in section_tasks if st.parent_id == task.id]:
-                v += "\n**Sub-Tasks:**"
-                for subtask in subtasks:
-                    v += f"\n- {subtask.content} | [{subtask.id}]({subtask.url})"
-                    if due := await get_due_datetime(subtask):
-                        v += f" | Due {discord.utils.format_dt(due, 'R')}"
-            embed.add_field(
-                name=(
-                    (task.content[:253] + "...")
-                    if len(task.content) > 256
-                    else task.content
-                ),
-                value=v,
-                inline=False,
-            )
-        return embed
-
+) -> PlanPaginator:
     # TODO: Make The Sorting And Filtering Of Tasks More Efficient
     annotated_tasks = [
         (await get_due_datetime(t) or datetime.max, t.id, t) for t in tasks
@@ -82,15 +134,20 @@ async def create_pages(
             projects["Inbox"].append(task)
 
     pgs = []
+    selectors = []
     for category, tasks in projects.items():
         split_pages = [tasks[i: i + 10] for i in range(0, len(tasks), 10)]
         complete_split_pages = []
         for group in split_pages:
             view = discord.ui.View()
-            view.add_item(TaskSelector(group))
-            complete_split_pages.append(
-                pages.Page(embeds=[await create_embed(group)], custom_view=view)
-            )
+            selector = TaskSelector(group)
+            view.add_item(selector)
+            page = pages.Page(embeds=[await create_embed(group)], custom_view=view)
+            selector.page = page
+            selectors.append(selector)
+            complete_split_pages.append(page)
         pgs.append(pages.PageGroup(label=category, pages=complete_split_pages))
 
-    return pages.Paginator(pages=pgs, show_menu=True, menu_placeholder="Project")
+    return PlanPaginator(
+        pages=pgs, show_menu=True, menu_placeholder="Project", selectors=selectors
+    )
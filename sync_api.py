@@ -0,0 +1,35 @@
+import aiohttp
+
+SYNC_URL = "https://api.todoist.com/sync/v9/sync"
+
+
+class TodoistSyncAPI:
+    """
+    Sends Batches Of Commands To The ToDoist Sync API
+    The REST Wrapper Has No Way To Batch Commands So This Covers That Gap
+    """
+
+    def __init__(self, token: str | None, timeout: float = 30) -> None:
+        self.token = token
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.session: aiohttp.ClientSession | None = None
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        # Created Lazily As A Session Needs To Be Made Inside The Running Event Loop
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                headers={"Authorization": f"Bearer {self.token}"},
+                timeout=self.timeout,
+            )
+        return self.session
+
+    async def close(self) -> None:
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    async def sync(self, commands: list[dict]) -> dict:
+        session = await self.get_session()
+        async with session.post(SYNC_URL, json={"commands": commands}) as response:
+            response.raise_for_status()
+            return await response.json()
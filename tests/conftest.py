@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The Modules Live At The Top Level Of The Repo Rather Than In A Package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,158 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+import bulk
+from bulk import MAX_COMMANDS, add_tasks_bulk, parse_lines
+from sync_api import TodoistSyncAPI
+
+
+class FakeSyncAPI:
+    def __init__(self, respond=None, error: Exception | None = None) -> None:
+        # Called With The Commands And Returns The Response Body
+        self.respond = respond or self.all_ok
+        self.error = error
+        self.calls: list[list[dict]] = []
+
+    @staticmethod
+    def all_ok(commands: list[dict]) -> dict:
+        return {
+            "sync_status": {c["uuid"]: "ok" for c in commands},
+            "temp_id_mapping": {c["temp_id"]: f"real-{i}" for i, c in enumerate(commands)},
+        }
+
+    async def sync(self, commands: list[dict]) -> dict:
+        self.calls.append(commands)
+        if self.error:
+            raise self.error
+        return self.respond(commands)
+
+
+@pytest.fixture
+def fake_sync(monkeypatch):
+    def install(**kwargs) -> FakeSyncAPI:
+        fake = FakeSyncAPI(**kwargs)
+        monkeypatch.setattr(bulk, "sync_api", fake)
+        return fake
+
+    return install
+
+
+def parse(text: str):
+    return asyncio.run(parse_lines(text))
+
+
+def test_indentation_links_parents():
+    lines = parse("Groceries\n  Milk\n    Oat\n  Eggs\nLaundry\n\tFold")
+    assert [(line.content, line.depth) for line in lines] == [
+        ("Groceries", 0),
+        ("Milk", 1),
+        ("Oat", 2),
+        ("Eggs", 1),
+        ("Laundry", 0),
+        ("Fold", 1),
+    ]
+    parents = {line.content: line.parent and line.parent.content for line in lines}
+    assert parents == {
+        "Groceries": None,
+        "Milk": "Groceries",
+        "Oat": "Milk",
+        "Eggs": "Groceries",
+        "Laundry": None,
+        "Fold": "Laundry",
+    }
+
+
+def test_dedent_to_an_in_between_level():
+    # "C" Is Less Indented Than "B" But More Than "A" So It Becomes A Sibling Of "B"
+    lines = parse("A\n        B\n    C")
+    assert [(line.content, line.parent and line.parent.content) for line in lines] == [
+        ("A", None),
+        ("B", "A"),
+        ("C", "A"),
+    ]
+
+
+def test_bullets_and_blank_lines():
+    lines = parse("- First\n\n   \n* Second\n  - Child\n-\nNo-Bullet")
+    assert [line.content for line in lines] == ["First", "Second", "Child", "No-Bullet"]
+    assert [line.line_number for line in lines] == [1, 4, 5, 7]
+    assert lines[2].parent is lines[1]
+
+
+def test_commands_reference_parent_temp_ids(fake_sync):
+    fake = fake_sync()
+    lines = parse("Parent\n  Child")
+    asyncio.run(add_tasks_bulk(lines))
+
+    assert len(fake.calls) == 1
+    parent, child = fake.calls[0]
+    assert parent["type"] == child["type"] == "item_add"
+    assert parent["args"] == {"content": "Parent"}
+    assert child["args"] == {"content": "Child", "parent_id": parent["temp_id"]}
+    assert parent["uuid"] != child["uuid"]
+    assert [line.task_id for line in lines] == ["real-0", "real-1"]
+    assert all(line.error is None for line in lines)
+
+
+def test_command_cap(fake_sync):
+    fake = fake_sync()
+    lines = parse("\n".join(f"Task {i}" for i in range(MAX_COMMANDS + 5)))
+    asyncio.run(add_tasks_bulk(lines))
+
+    assert len(fake.calls) == 1
+    assert len(fake.calls[0]) == MAX_COMMANDS
+    assert all(line.task_id for line in lines[:MAX_COMMANDS])
+    assert all(line.error and not line.task_id for line in lines[MAX_COMMANDS:])
+
+
+def test_statuses_are_mapped_to_each_line(fake_sync):
+    def respond(commands: list[dict]) -> dict:
+        ok, failed, missing = commands
+        return {
+            "sync_status": {
+                ok["uuid"]: "ok",
+                failed["uuid"]: {"error_code": 20, "error": "Invalid Argument"},
+            },
+            "temp_id_mapping": {ok["temp_id"]: "123"},
+        }
+
+    fake_sync(respond=respond)
+    lines = parse("Works\nFails\nMissing")
+    asyncio.run(add_tasks_bulk(lines))
+
+    assert [(line.task_id, line.error) for line in lines] == [
+        ("123", None),
+        (None, "Invalid Argument"),
+        (None, "Unknown Error"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"error": asyncio.TimeoutError()},
+        {"error": aiohttp.ClientError("Connection Reset")},
+        {"respond": lambda commands: {"unexpected": True}},
+    ],
+)
+def test_request_failures_mark_every_line(fake_sync, kwargs):
+    fake_sync(**kwargs)
+    lines = parse("One\n  Two")
+    asyncio.run(add_tasks_bulk(lines))
+
+    assert all(line.error and not line.task_id for line in lines)
+
+
+def test_sync_api_reuses_and_closes_its_session():
+    async def run():
+        sync_api = TodoistSyncAPI("token")
+        session = await sync_api.get_session()
+        assert await sync_api.get_session() is session
+        await sync_api.close()
+        return sync_api, session
+
+    sync_api, session = asyncio.run(run())
+    assert session.closed
+    assert sync_api.session is None
@@ -0,0 +1,181 @@
+import asyncio
+
+from todoist_api_python.models import Task
+
+from caches import CachedTask, TaskCache
+from events import TaskEventBus
+
+
+def make_task(task_id: str, **overrides) -> Task:
+    data = {
+        "assignee_id": None,
+        "assigner_id": None,
+        "comment_count": 0,
+        "is_completed": False,
+        "content": f"Task {task_id}",
+        "created_at": "2024-05-01T12:00:00.000000Z",
+        "creator_id": "42",
+        "description": "",
+        "due": None,
+        "id": task_id,
+        "labels": ["work"],
+        "order": 1,
+        "parent_id": None,
+        "priority": 1,
+        "project_id": "100",
+        "section_id": None,
+        "url": f"https://todoist.com/showTask?id={task_id}",
+    }
+    data.update(overrides)
+    return Task.from_dict(data)
+
+
+DUE = {
+    "date": "2024-05-02",
+    "is_recurring": True,
+    "string": "every day",
+    "datetime": "2024-05-02T12:00:00Z",
+    "timezone": "Europe/London",
+}
+
+
+def test_cached_task_round_trip():
+    for task in (
+        make_task("1"),
+        make_task("2", labels=None, due=None),
+        make_task("3", labels=[], due=DUE, parent_id="1", section_id="5"),
+        make_task("4", labels=["work", "home"], is_completed=True, priority=4),
+    ):
+        cached = CachedTask(task)
+        assert cached.to_task() == task
+        assert cached.to_task().to_dict() == task.to_dict()
+        assert CachedTask(cached.to_task()) == cached
+
+
+def test_cached_task_does_not_change_original():
+    task = make_task("1", due=DUE)
+    due = task.due
+    CachedTask(task).to_task().labels.append("home")
+    assert task.labels == ["work"]
+    assert task.due is due
+
+
+def test_cached_task_interns_repeated_strings():
+    def fresh(text: str) -> str:
+        # Rebuild The String So Each Task Starts With Its Own Copy
+        return "".join(list(text))
+
+    first, second = (
+        CachedTask(
+            make_task(
+                fresh("7000000001"),
+                project_id=fresh("2200000000"),
+                labels=[fresh("errands")],
+                due=dict(DUE, string=fresh("every day")),
+            )
+        )
+        for _ in range(2)
+    )
+    assert first.id is second.id
+    assert first.project_id is second.project_id
+    assert first.labels[0] is second.labels[0]
+    assert first.due.string is second.due.string
+
+
+def test_cached_task_equality_and_hash():
+    first = CachedTask(make_task("1"))
+    assert first == CachedTask(make_task("1"))
+    assert first != CachedTask(make_task("1", content="Edited"))
+    assert hash(first) == hash(CachedTask(make_task("1", content="Edited")))
+    assert len({first, CachedTask(make_task("1")), CachedTask(make_task("2"))}) == 2
+
+
+class FakeAPI:
+    def __init__(self) -> None:
+        self.tasks: list[Task] = []
+
+    async def get_tasks(self) -> list[Task]:
+        return list(self.tasks)
+
+
+class RecordingBus(TaskEventBus):
+    def __init__(self) -> None:
+        super().__init__(delay=0)
+        self.published = []
+
+    def publish(self, task, source=None) -> None:
+        self.published.append((task, source))
+
+
+def test_task_cache_publishes_changes_and_removals():
+    async def run():
+        api = FakeAPI()
+        bus = RecordingBus()
+        cache = TaskCache(0, api, bus)
+        api.tasks = [make_task("1"), make_task("2"), make_task("3")]
+        await cache.get_tasks()
+        assert bus.published == []
+
+        api.tasks = [make_task("1"), make_task("2", content="Edited")]
+        await cache.get_tasks()
+        return bus.published
+
+    published = asyncio.run(run())
+    assert {t.id: (t.content, t.is_completed) for t, _ in published} == {
+        "2": ("Edited", False),
+        "3": ("Task 3", True),
+    }
+
+
+def test_task_cache_does_not_echo_view_changes():
+    async def run():
+        api = FakeAPI()
+        bus = RecordingBus()
+        cache = TaskCache(0, api, bus)
+        api.tasks = [make_task("1"), make_task("2")]
+        await cache.get_tasks()
+
+        view = object()
+        cache.publish(make_task("1", content="Edited"), source=view)
+        cache.publish(make_task("2", is_completed=True), source=view)
+        api.tasks = [make_task("1", content="Edited")]
+        await cache.get_tasks()
+        return bus.published, view
+
+    published, view = asyncio.run(run())
+    assert [source for _, source in published] == [view, view]
+
+
+def test_task_cache_compares_first_fetch_against_remembered_tasks():
+    async def run():
+        api = FakeAPI()
+        bus = RecordingBus()
+        cache = TaskCache(0, api, bus)
+        # A View Is Opened Before The Cache Has Ever Been Fetched
+        cache.remember(make_task("1"))
+        cache.remember(make_task("2"))
+        api.tasks = [make_task("2", content="Edited")]
+        await cache.get_tasks()
+        return bus.published
+
+    published = asyncio.run(run())
+    assert {t.id: (t.content, t.is_completed) for t, _ in published} == {
+        "1": ("Task 1", True),
+        "2": ("Edited", False),
+    }
+
+
+def test_task_cache_update_uses_full_fetch_as_baseline():
+    async def run():
+        api = FakeAPI()
+        bus = RecordingBus()
+        cache = TaskCache(60, api, bus)
+        cache.update([make_task("1")])
+        # The Fetch Passed To update Counts Towards The Cooldown
+        api.tasks = [make_task("1", content="Edited")]
+        tasks = await cache.get_tasks()
+        return tasks, bus.published
+
+    tasks, published = asyncio.run(run())
+    assert [t.content for t in tasks] == ["Task 1"]
+    assert published == []
@@ -0,0 +1,148 @@
+import asyncio
+import gc
+from types import SimpleNamespace
+
+from events import TaskEventBus
+
+
+class FakeView:
+    def __init__(self) -> None:
+        self.updates = []
+
+    async def on_task_update(self, task) -> None:
+        self.updates.append(task)
+
+
+class BrokenView:
+    async def on_task_update(self, task) -> None:
+        raise RuntimeError("Broken")
+
+
+def make_task(task_id: str, content: str = "Task"):
+    return SimpleNamespace(id=task_id, content=content)
+
+
+def test_fan_out_to_many_views():
+    async def run():
+        bus = TaskEventBus(delay=0)
+        views = [FakeView() for _ in range(500)]
+        for view in views:
+            bus.subscribe("1", view)
+        other = FakeView()
+        bus.subscribe("2", other)
+
+        task = make_task("1")
+        bus.publish(task)
+        await asyncio.sleep(0.01)
+        return views, other, task
+
+    views, other, task = asyncio.run(run())
+    assert all(view.updates == [task] for view in views)
+    assert other.updates == []
+
+
+def test_debounce_merges_updates():
+    async def run():
+        bus = TaskEventBus(delay=0.05)
+        view = FakeView()
+        bus.subscribe("1", view)
+        for i in range(10):
+            bus.publish(make_task("1", content=str(i)))
+        await asyncio.sleep(0.1)
+        return view
+
+    view = asyncio.run(run())
+    assert [t.content for t in view.updates] == ["9"]
+
+
+def test_source_is_excluded():
+    async def run():
+        bus = TaskEventBus(delay=0)
+        source, other = FakeView(), FakeView()
+        bus.subscribe("1", source)
+        bus.subscribe("1", other)
+        bus.publish(make_task("1"), source=source)
+        await asyncio.sleep(0.01)
+        return source, other
+
+    source, other = asyncio.run(run())
+    assert source.updates == []
+    assert len(other.updates) == 1
+
+
+def test_different_sources_are_merged_for_everyone():
+    async def run():
+        bus = TaskEventBus(delay=0.05)
+        first, second = FakeView(), FakeView()
+        bus.subscribe("1", first)
+        bus.subscribe("1", second)
+        bus.publish(make_task("1"), source=first)
+        bus.publish(make_task("1"), source=second)
+        await asyncio.sleep(0.1)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert len(first.updates) == 1
+    assert len(second.updates) == 1
+
+
+def test_failing_subscriber_is_logged_and_others_still_update(caplog):
+    async def run():
+        bus = TaskEventBus(delay=0)
+        view = FakeView()
+        broken = BrokenView()
+        bus.subscribe("1", broken)
+        bus.subscribe("1", view)
+        bus.publish(make_task("1"))
+        await asyncio.sleep(0.01)
+        return view, broken
+
+    view, broken = asyncio.run(run())
+    assert len(view.updates) == 1
+    assert "Broken" in caplog.text
+
+
+def test_collected_subscribers_are_pruned():
+    bus = TaskEventBus(delay=0)
+    views = [FakeView() for _ in range(1000)]
+    for i, view in enumerate(views):
+        bus.subscribe(str(i), view)
+    kept = FakeView()
+    bus.subscribe("kept", kept)
+    assert len(bus.subscribers) == 1001
+
+    del views, view
+    gc.collect()
+    assert list(bus.subscribers) == ["kept"]
+
+
+def test_unsubscribe_removes_empty_sets():
+    bus = TaskEventBus(delay=0)
+    view = FakeView()
+    bus.subscribe("1", view)
+    bus.unsubscribe("1", view)
+    assert bus.subscribers == {}
+
+
+def test_refresh_runs_while_subscribed():
+    async def run():
+        bus = TaskEventBus(delay=0, refresh_interval=0.01)
+        calls = []
+
+        async def refresh():
+            calls.append(1)
+
+        bus.refresh = refresh
+        view = FakeView()
+        bus.subscribe("1", view)
+        await asyncio.sleep(0.05)
+        assert calls
+
+        bus.unsubscribe("1", view)
+        await asyncio.sleep(0.03)
+        assert bus.refresher is None
+        count = len(calls)
+        await asyncio.sleep(0.03)
+        assert len(calls) == count
+
+    asyncio.run(run())
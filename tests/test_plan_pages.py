@@ -0,0 +1,61 @@
+import asyncio
+from dataclasses import replace
+
+from todoist_api_python.models import Task
+
+from plan_pages import create_pages
+from initialization import task_events
+
+
+def make_task(task_id: str, **overrides) -> Task:
+    data = {
+        "assignee_id": None,
+        "assigner_id": None,
+        "comment_count": 0,
+        "is_completed": False,
+        "content": f"Task {task_id}",
+        "created_at": "2024-05-01T12:00:00.000000Z",
+        "creator_id": "42",
+        "description": "",
+        "due": None,
+        "id": task_id,
+        "labels": [],
+        "order": 1,
+        "parent_id": None,
+        "priority": 1,
+        "project_id": None,
+        "section_id": None,
+        "url": f"https://todoist.com/showTask?id={task_id}",
+    }
+    data.update(overrides)
+    return Task.from_dict(data)
+
+
+def test_completed_task_is_marked_on_the_page():
+    async def run():
+        paginator = await create_pages([make_task("1"), make_task("2")], [])
+        selector = paginator.selectors[0]
+        await selector.on_task_update(replace(selector.tasks["1"], is_completed=True))
+        return selector
+
+    selector = asyncio.run(run())
+    labels = {option.value: option.label for option in selector.options}
+    assert labels == {"1": "✅ Task 1", "2": "Task 2"}
+    names = [field.name for field in selector.page.embeds[0].fields]
+    assert names == ["✅ Task 1", "Task 2"]
+
+
+def test_paginator_unsubscribes_when_finished():
+    async def run():
+        timed_out = await create_pages([make_task("10"), make_task("11")], [])
+        stopped = await create_pages([make_task("12")], [])
+        assert {"10", "11", "12"} <= set(task_events.subscribers)
+
+        timed_out.disable_on_timeout = False
+        await timed_out.on_timeout()
+        stopped.stop()
+        return timed_out, stopped
+
+    # Keep The Paginators Alive So Only Unsubscribing Can Empty The Sets
+    timed_out, stopped = asyncio.run(run())
+    assert not {"10", "11", "12"} & set(task_events.subscribers)
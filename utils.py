@@ -5,6 +5,7 @@ import discord
 from discord.utils import format_dt
 from todoist_api_python.models import Task, Label
 from initialization import task_cache
+from caches import CachedTask
 
 
 PRIORITY = {
@@ -79,7 +80,9 @@ async def get_label_object(target: str, labels: list[Label]) -> Label:
             return label
 
 
-async def get_subtasks_recursive(parent: Task, tasks: list[Task]) -> tuple[dict[str, dict], dict[str, Task]]:
+async def get_subtasks_recursive(
+    parent: Task | CachedTask, tasks: list[Task | CachedTask]
+) -> tuple[dict[str, dict], dict[str, Task | CachedTask]]:
     """
     Recursively find all subtasks given a parent task.
     Returns a table and a reference.
@@ -91,7 +94,7 @@ async def get_subtasks_recursive(parent: Task, tasks: list[Task]) -> tuple[dict[
     """
     children = [t for t in tasks if t.parent_id == parent.id]
     all_children: dict[str, dict] = {}
-    linked_children: dict[str, Task] = {}
+    linked_children: dict[str, Task | CachedTask] = {}
 
     for child in children:
         table, reference = await get_subtasks_recursive(child, tasks)
@@ -102,7 +105,7 @@ async def get_subtasks_recursive(parent: Task, tasks: list[Task]) -> tuple[dict[
     return all_children, linked_children
 
 
-async def format_subtasks(subtasks: dict[str, dict], reference: dict[str, Task], level=0) -> str:
+async def format_subtasks(subtasks: dict[str, dict], reference: dict[str, Task | CachedTask], level=0) -> str:
     result = ""
     for t_id, children in subtasks.items():
         result += "  " * level + f"- {"✅ " if reference[t_id].is_completed else ""}{await get_shortened(reference[t_id].content, 50)}\n"
@@ -1,9 +1,11 @@
 import discord
 from discord import Interaction
+from dataclasses import fields
 from todoist_api_python.models import Task, Label
 import asyncio
 from utils import get_task_info, LABEL_EMOJIS
-from initialization import api, label_cache
+from initialization import api, label_cache, task_cache, task_events
+from caches import CachedTask
 
 
 class AddTaskOptions(discord.ui.View):
@@ -12,7 +14,7 @@ class AddTaskOptions(discord.ui.View):
         task: Task,
         labels: list[Label],
         parents: list[str] | None = None,
-        subtasks: tuple[dict[str, dict], dict[str, Task]] = None,
+        subtasks: tuple[dict[str, dict], dict[str, Task | CachedTask]] = None,
     ):
         super().__init__(timeout=300, disable_on_timeout=True)
         self.task = task
@@ -28,6 +30,35 @@ class AddTaskOptions(discord.ui.View):
         if len(self.parents) == 4:
             self.children[1].disabled = True
 
+        task_cache.remember(task)
+        task_events.subscribe(task.id, self)
+
+    async def on_timeout(self):
+        task_events.unsubscribe(self.task.id, self)
+        await super().on_timeout()
+
+    def stop(self):
+        task_events.unsubscribe(self.task.id, self)
+        super().stop()
+
+    async def on_task_update(self, task: Task):
+        if self.is_finished() or self.message is None:
+            return
+        # Update In Place So The Buttons And Selects Keep Pointing At The Same Task
+        for field in fields(task):
+            setattr(self.task, field.name, getattr(task, field.name))
+        for item in self.children:
+            if isinstance(item, (CompleteTask, TaskLabeler)):
+                item.sync()
+        try:
+            await self.message.edit(
+                embed=await get_task_info(self.task, label_cache.labels or []),
+                view=self,
+            )
+        except discord.HTTPException:
+            # The Interaction Token Has Likely Expired So The Message Can No Longer Be Edited
+            task_events.unsubscribe(self.task.id, self)
+
     @discord.ui.button(label="Add Info", style=discord.ButtonStyle.blurple)
     async def add_desc(
         self, button: discord.ui.Button, interaction: discord.Interaction
@@ -131,12 +162,17 @@ class AddDesc(discord.ui.Modal):
         self.task.due = response.due
         self.task.priority = priority
         self.task.labels = labels
+        for item in self.parent_view.children:
+            if isinstance(item, TaskLabeler):
+                item.sync()
         await interaction.followup.edit_message(
             self.parent_view.message.id,
             embed=await get_task_info(
                 self.task, await label_cache.get_labels(interaction.user.id)
             ),
+            view=self.parent_view,
         )
+        task_cache.publish(self.task, source=self.parent_view)
 
 
 class CompleteTask(discord.ui.Button):
@@ -153,6 +189,8 @@ class CompleteTask(discord.ui.Button):
         await asyncio.sleep(5)
         await api.close_task(self.task.id)
         self.completed = True
+        self.task.is_completed = True
+        task_cache.publish(self.task, source=self.view)
 
     async def mark_as_uncomplete(self):
         if not self.completed:
@@ -160,22 +198,37 @@ class CompleteTask(discord.ui.Button):
         await asyncio.sleep(5)
         await api.reopen_task(self.task.id)
         self.completed = False
+        self.task.is_completed = False
+        task_cache.publish(self.task, source=self.view)
+
+    def set_appearance(self, completed: bool):
+        if completed:
+            self.label = "Un-Complete"
+            self.emoji = "↩"
+            self.style = discord.ButtonStyle.red
+        else:
+            self.label = "Complete"
+            self.emoji = "✅"
+            self.style = discord.ButtonStyle.green
+
+    def sync(self):
+        # Do Not Override A Change The User Is Still Waiting On
+        if self.future and not self.future.done():
+            return
+        self.want_completed = self.completed = self.task.is_completed
+        self.set_appearance(self.completed)
 
     async def callback(self, interaction: Interaction):
         if self.future:
             self.future.cancel()
 
         if self.want_completed:
-            self.label = "Complete"
-            self.emoji = "✅"
-            self.style = discord.ButtonStyle.green
+            self.set_appearance(False)
             await interaction.edit(view=self.view)
             self.want_completed = False
             self.future = asyncio.ensure_future(self.mark_as_uncomplete())
         else:
-            self.label = "Un-Complete"
-            self.emoji = "↩"
-            self.style = discord.ButtonStyle.red
+            self.set_appearance(True)
             await interaction.edit(view=self.view)
             self.want_completed = True
             self.future = asyncio.ensure_future(self.mark_as_complete())
@@ -217,24 +270,25 @@ class TaskLabeler(discord.ui.Select):
             placeholder="Select Labels",
         )
 
+    def sync(self):
+        for option in self.options:
+            option.default = option.label in self.task.labels
+
     async def callback(self, interaction: discord.Interaction):
         await api.update_task(self.task.id, labels=self.values)
-        for option in self.options:
-            if option.label in self.values:
-                option.default = True
-            else:
-                option.default = False
         self.task.labels = self.values
+        self.sync()
         await interaction.response.edit_message(
             embed=await get_task_info(
                 self.task, await label_cache.get_labels(interaction.user.id)
             ),
             view=self.view,
         )
+        task_cache.publish(self.task, source=self.view)
 
 
 class SubTaskSelector(discord.ui.Select):
-    def __init__(self, subtasks: list[Task]):
+    def __init__(self, subtasks: list[Task | CachedTask]):
         self.subtasks = subtasks
         options = [
             discord.SelectOption(